@@ -1,10 +1,29 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from loguru import logger
 
+import database
 from routers import matches, strategies, tournaments
+from src.models import Base
+from src.strategy import close_docker_client, get_docker_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    Base.metadata.create_all(bind=database.engine)
+    try:
+        await get_docker_client()
+    except Exception as e:
+        # Result pages work without Docker, tournaments retry on start
+        logger.warning(f"Docker daemon not reachable: {str(e)}")
+    yield
+    close_docker_client()
+
 
-app = FastAPI(title="Tournament")
+app = FastAPI(title="Tournament", lifespan=lifespan)
 
 app.mount("/static", StaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
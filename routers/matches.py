@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 
 from database import get_db
 from src.models import Match, Side, Strategy, Turn
+from src.response_cache import response_cache
 
 router = APIRouter(prefix="/matches")
 templates = Jinja2Templates(directory="templates")
@@ -11,6 +12,10 @@ templates = Jinja2Templates(directory="templates")
 
 @router.get("/{match_id}")
 async def match_detail(request: Request, match_id: int, db: Session = Depends(get_db)):
+    cache_key = ("match_detail", match_id)
+    if (cached := response_cache.get(request, cache_key)) is not None:
+        return cached
+
     match = db.get(Match, match_id)
     if not match:
         raise HTTPException(status_code=404, detail="Match not found")
@@ -35,7 +40,7 @@ async def match_detail(request: Request, match_id: int, db: Session = Depends(ge
     for idx, (turn1, turn2) in enumerate(turns):
         assert turn1.turn_number == turn2.turn_number == idx
 
-    return templates.TemplateResponse(
+    response = templates.TemplateResponse(
         "match_detail.html",
         {
             "request": request,
@@ -45,3 +50,6 @@ async def match_detail(request: Request, match_id: int, db: Session = Depends(ge
             "strategy2": strategy2,
         },
     )
+    return response_cache.store(
+        request, cache_key, response, final=match.status == "completed"
+    )
@@ -4,11 +4,17 @@ from sqlalchemy.orm import Session
 
 from database import get_db
 from src.models import Strategy
+from src.response_cache import response_cache
 
 router = APIRouter(prefix="/strategies")
 templates = Jinja2Templates(directory="templates")
 
 
+def _clear_response_cache():
+    # Strategy names are rendered into every cached page
+    response_cache.clear()
+
+
 @router.get("/")
 async def list_strategies(request: Request, db: Session = Depends(get_db)):
     strategies = db.query(Strategy).all()
@@ -24,6 +30,7 @@ async def add_strategy(
     strategy = Strategy(name=name, docker_image=docker_image)
     db.add(strategy)
     db.commit()
+    _clear_response_cache()
     return {"success": True}
 
 
@@ -35,6 +42,7 @@ async def rename_strategy(
     assert strategy is not None
     strategy.name = name
     db.commit()
+    _clear_response_cache()
     return {"success": True}
 
 
@@ -42,4 +50,5 @@ async def rename_strategy(
 async def delete_strategy(strategy_id: int, db: Session = Depends(get_db)):
     db.query(Strategy).filter(Strategy.id == strategy_id).delete()
     db.commit()
+    _clear_response_cache()
     return {"success": True}
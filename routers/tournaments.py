@@ -1,13 +1,25 @@
 from operator import itemgetter
 
 from fastapi import APIRouter, BackgroundTasks, Depends, Form, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import RedirectResponse
 from fastapi.templating import Jinja2Templates
 from sqlalchemy import case, func
 from sqlalchemy.orm import Session
 
 from database import get_db
-from src.models import Match, Round, Side, Strategy, Tournament, Turn
+from src.analytics import StrategyAnalytics, tournament_analytics
+from src.ecological import MAX_GENERATIONS
+from src.models import (
+    Match,
+    PopulationShare,
+    Round,
+    Side,
+    Strategy,
+    Tournament,
+    Turn,
+)
+from src.response_cache import response_cache
 from src.tournament import TournamentRunner
 
 router = APIRouter(prefix="/tournaments")
@@ -16,12 +28,22 @@ templates = Jinja2Templates(directory="templates")
 
 @router.get("/")
 async def list_tournaments(request: Request, db: Session = Depends(get_db)):
+    cache_key = ("list_tournaments",)
+    if (cached := response_cache.get(request, cache_key)) is not None:
+        return cached
+
     tournaments = db.query(Tournament).all()
     strategies = db.query(Strategy).all()
-    return templates.TemplateResponse(
+    response = templates.TemplateResponse(
         "tournaments.html",
-        {"request": request, "tournaments": tournaments, "strategies": strategies},
+        {
+            "request": request,
+            "tournaments": tournaments,
+            "strategies": strategies,
+            "max_generations": MAX_GENERATIONS,
+        },
     )
+    return response_cache.store(request, cache_key, response, final=False)
 
 
 @router.post("/start")
@@ -30,14 +52,19 @@ async def start_tournament(
     background_tasks: BackgroundTasks,
     strategy_ids: list[int] = Form(..., alias="strategy_ids[]"),
     rounds_count: int = Form(...),
+    generations_count: int = Form(0, ge=0, le=MAX_GENERATIONS),
     db: Session = Depends(get_db),
 ):
     print("Received strategy_ids:", strategy_ids)
     tournament_runner = TournamentRunner(
-        strategy_ids=strategy_ids, rounds_count=rounds_count, session=db
+        strategy_ids=strategy_ids,
+        rounds_count=rounds_count,
+        session=db,
+        generations_count=generations_count,
     )
     # Add the tournament execution to background tasks
     background_tasks.add_task(tournament_runner.run, db)
+    response_cache.invalidate(("list_tournaments",))
 
     return RedirectResponse(
         url=f"/tournaments/{tournament_runner.tournament_id}", status_code=303
@@ -51,6 +78,10 @@ async def tournament_detail(
     round_number: int | None = None,
     session: Session = Depends(get_db),
 ):
+    cache_key = ("tournament_detail", tournament_id, round_number)
+    if (cached := response_cache.get(request, cache_key)) is not None:
+        return cached
+
     tournament = session.get(Tournament, tournament_id)
     if not tournament:
         raise HTTPException(status_code=404, detail="Tournament not found")
@@ -122,7 +153,40 @@ async def tournament_detail(
         )
     }
 
-    return templates.TemplateResponse(
+    # Analytics scan every turn of the tournament, so they are only computed once
+    # it has completed, and off the event loop that runs the matches
+    analytics: dict[int, StrategyAnalytics] = {}
+    if tournament.status == "completed":
+        analytics = await run_in_threadpool(
+            tournament_analytics, tournament_id, session
+        )
+
+    # Sample about ten generations of the ecological run, including the last one
+    last_generation = (
+        session.query(func.max(PopulationShare.generation))
+        .filter(PopulationShare.tournament_id == tournament_id)
+        .scalar()
+    )
+    population: dict[int, dict[int, float]] = {}
+    if last_generation is not None:
+        step = max(1, last_generation // 10)
+        shares_query = (
+            session.query(
+                PopulationShare.generation,
+                PopulationShare.strategy_id,
+                PopulationShare.share,
+            )
+            .filter(PopulationShare.tournament_id == tournament_id)
+            .filter(
+                (PopulationShare.generation % step == 0)
+                | (PopulationShare.generation == last_generation)
+            )
+            .order_by(PopulationShare.generation)
+        )
+        for generation, strategy_id, share in shares_query.all():
+            population.setdefault(generation, {})[strategy_id] = share
+
+    response = templates.TemplateResponse(
         "tournament_detail.html",
         {
             "request": request,
@@ -132,5 +196,10 @@ async def tournament_detail(
             "round_number": round_number,
             "strategy_scores": strategy_scores,
             "strategy_lookup": strategy_lookup,
+            "analytics": analytics,
+            "population": population,
         },
     )
+    return response_cache.store(
+        request, cache_key, response, final=tournament.status == "completed"
+    )
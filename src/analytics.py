@@ -0,0 +1,224 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable
+
+import numpy as np
+import numpy.typing as npt
+from sqlalchemy import Text, cast, func, literal_column
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import Session
+
+from .models import Match, MoveType, Round, Side, Tournament, Turn
+
+# Turns after a stray defection in which the reaction is measured
+NOISE_WINDOW = 5
+# Number of completed tournaments whose analytics are kept in memory
+CACHE_SIZE = 128
+
+DEFECT = ord(MoveType.D.value)
+
+# Shared by the threads tournament pages compute analytics in
+_cache: OrderedDict[int, dict[int, "StrategyAnalytics"]] = OrderedDict()
+_cache_lock = threading.Lock()
+# Held while a tournament is computed, so concurrent requests scan it once
+_compute_locks: dict[int, threading.Lock] = {}
+
+
+@dataclass
+class StrategyAnalytics:
+    # Share of own moves that were cooperations
+    cooperation_rate: float | None
+    # Share of opponent defections answered with a defection on the next turn
+    retaliation_rate: float | None
+    # Share of retaliations followed by cooperation once the opponent cooperated again
+    forgiveness_rate: float | None
+    # Average turn of the first own defection, over matches with a defection
+    first_defection_turn: float | None
+    # Own defection rate in the turns after a single defection broke mutual cooperation
+    noise_sensitivity: float | None
+
+
+def tournament_analytics(
+    tournament_id: int, session: Session
+) -> dict[int, StrategyAnalytics]:
+    with _cache_lock:
+        if (analytics := _cached(tournament_id)) is not None:
+            return analytics
+        compute_lock = _compute_locks.setdefault(tournament_id, threading.Lock())
+
+    with compute_lock:
+        # Another request may have computed it while this one waited
+        with _cache_lock:
+            if (analytics := _cached(tournament_id)) is not None:
+                return analytics
+
+        tournament = session.get(Tournament, tournament_id)
+        assert tournament is not None
+        analytics = compute_analytics(*load_moves(tournament_id, session))
+
+        with _cache_lock:
+            if tournament.status == "completed":
+                _cache[tournament_id] = analytics
+                if len(_cache) > CACHE_SIZE:
+                    _cache.popitem(last=False)
+            _compute_locks.pop(tournament_id, None)
+    return analytics
+
+
+def _cached(tournament_id: int) -> dict[int, StrategyAnalytics] | None:
+    analytics = _cache.get(tournament_id)
+    if analytics is not None:
+        _cache.move_to_end(tournament_id)
+    return analytics
+
+
+def load_moves(
+    tournament_id: int, session: Session
+) -> tuple[npt.NDArray[np.int64], list[npt.NDArray[np.bool_]]]:
+    """Load the moves of a tournament as one packed move string per match side."""
+
+    def side_moves(side: Side):
+        return func.string_agg(
+            cast(Turn.move, Text),
+            aggregate_order_by(literal_column("''"), Turn.turn_number),
+        ).filter(Turn.side == side)
+
+    rows = (
+        session.query(
+            Match.strategy1_id,
+            Match.strategy2_id,
+            side_moves(Side.strategy1),
+            side_moves(Side.strategy2),
+        )
+        .join(Turn, Turn.match_id == Match.id)
+        .join(Round, Match.round_id == Round.id)
+        .filter(Round.tournament_id == tournament_id)
+        .group_by(Match.id)
+        .all()
+    )
+    return unpack_moves(rows)
+
+
+def unpack_moves(
+    rows: Iterable[tuple[int, int, str | None, str | None]],
+) -> tuple[npt.NDArray[np.int64], list[npt.NDArray[np.bool_]]]:
+    """Unpack (strategy1_id, strategy2_id, moves1, moves2) rows into move arrays.
+
+    Returns the strategy id of each row and, grouped by match length, boolean
+    arrays of shape (2, rows, turns) holding own and opponent defections.
+    """
+    # Group matches by length so they can be stacked into 2D arrays
+    by_length: dict[int, tuple[list[int], list[int], list[str], list[str]]] = {}
+    for strategy1_id, strategy2_id, moves1, moves2 in rows:
+        if not moves1 or not moves2 or len(moves1) != len(moves2):
+            continue
+        group = by_length.setdefault(len(moves1), ([], [], [], []))
+        group[0].append(strategy1_id)
+        group[1].append(strategy2_id)
+        group[2].append(moves1)
+        group[3].append(moves2)
+
+    strategy_ids: list[npt.NDArray[np.int64]] = []
+    defections: list[npt.NDArray[np.bool_]] = []
+    for length, (ids1, ids2, moves1, moves2) in by_length.items():
+        defects1 = _unpack(moves1, length)
+        defects2 = _unpack(moves2, length)
+        # Every match is seen once from each side
+        strategy_ids.append(np.array(ids1 + ids2, dtype=np.int64))
+        defections.append(
+            np.stack(
+                [np.vstack([defects1, defects2]), np.vstack([defects2, defects1])]
+            )
+        )
+
+    if not strategy_ids:
+        return np.empty(0, dtype=np.int64), []
+    return np.concatenate(strategy_ids), defections
+
+
+def _unpack(moves: list[str], length: int) -> npt.NDArray[np.bool_]:
+    packed = np.frombuffer("".join(moves).encode(), dtype=np.uint8)
+    return packed.reshape(len(moves), length) == DEFECT
+
+
+def compute_analytics(
+    strategy_ids: npt.NDArray[np.int64], defections: list[npt.NDArray[np.bool_]]
+) -> dict[int, StrategyAnalytics]:
+    if strategy_ids.size == 0:
+        return {}
+
+    # Per row counts: numerator / denominator pairs of every metric
+    counts = np.concatenate([_row_counts(own, opp) for own, opp in defections])
+
+    ids, index = np.unique(strategy_ids, return_inverse=True)
+    totals = np.stack(
+        [
+            np.bincount(index, weights=column, minlength=ids.size)
+            for column in counts.T
+        ],
+        axis=1,
+    )
+
+    def ratio(numerator: float, denominator: float) -> float | None:
+        return float(numerator / denominator) if denominator else None
+
+    return {
+        int(strategy_id): StrategyAnalytics(
+            cooperation_rate=ratio(row[0], row[1]),
+            retaliation_rate=ratio(row[2], row[3]),
+            forgiveness_rate=ratio(row[4], row[5]),
+            first_defection_turn=ratio(row[6], row[7]),
+            noise_sensitivity=ratio(row[8], row[9]),
+        )
+        for strategy_id, row in zip(ids, totals)
+    }
+
+
+def _row_counts(
+    own: npt.NDArray[np.bool_], opp: npt.NDArray[np.bool_]
+) -> npt.NDArray[np.float64]:
+    rows, turns = own.shape
+
+    cooperations = (~own).sum(axis=1)
+
+    provoked = opp[:, :-1]
+    retaliations = (provoked & own[:, 1:]).sum(axis=1)
+
+    # Own retaliation at t-1, after which the opponent cooperated again
+    retaliated = opp[:, :-2] & own[:, 1:-1] & ~opp[:, 1:-1]
+    forgiven = (retaliated & ~own[:, 2:]).sum(axis=1)
+
+    defected = own.any(axis=1)
+    first_defection = np.where(defected, own.argmax(axis=1), 0)
+
+    # Opponent defection at t right after mutual cooperation at t-1
+    triggers = ~own[:, :-1] & ~opp[:, :-1] & opp[:, 1:]
+    trigger_rows, trigger_turns = np.nonzero(triggers)
+    trigger_turns += 1
+    cumulative = np.zeros((rows, turns + 1), dtype=np.int64)
+    np.cumsum(own, axis=1, out=cumulative[:, 1:])
+    window_end = np.minimum(trigger_turns + NOISE_WINDOW, turns - 1)
+    reactions = (
+        cumulative[trigger_rows, window_end + 1]
+        - cumulative[trigger_rows, trigger_turns + 1]
+    )
+    noise_defections = np.bincount(trigger_rows, weights=reactions, minlength=rows)
+    noise_turns = np.bincount(
+        trigger_rows, weights=window_end - trigger_turns, minlength=rows
+    )
+
+    return np.column_stack(
+        [
+            cooperations,
+            np.full(rows, turns),
+            retaliations,
+            provoked.sum(axis=1),
+            forgiven,
+            retaliated.sum(axis=1),
+            first_defection,
+            defected,
+            noise_defections,
+            noise_turns,
+        ]
+    ).astype(np.float64)
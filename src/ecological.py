@@ -0,0 +1,126 @@
+from typing import Iterable
+
+import numpy as np
+import numpy.typing as npt
+from sqlalchemy import case, func, insert
+from sqlalchemy.orm import Session
+
+from .models import Match, PopulationShare, Round, Side, Turn
+
+# Upper bound on the generations of an ecological run
+MAX_GENERATIONS = 10_000
+# Population share rows inserted per statement
+INSERT_BATCH_SIZE = 5_000
+
+
+def payoff_matrix(
+    tournament_id: int, session: Session
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.float64]]:
+    """Average score per turn of every strategy (row) against every other (column).
+
+    Scores are averaged over all rounds of the tournament, so the number of
+    rounds is the number of repeats noisy strategies are sampled with.
+    """
+    strategy1_expr = func.sum(case((Turn.side == Side.strategy1, Turn.score), else_=0))
+    strategy2_expr = func.sum(case((Turn.side == Side.strategy2, Turn.score), else_=0))
+    turns_expr = func.count(Turn.id) / 2
+
+    rows = (
+        session.query(
+            Match.strategy1_id,
+            Match.strategy2_id,
+            strategy1_expr,
+            strategy2_expr,
+            turns_expr,
+        )
+        .join(Match, Turn.match_id == Match.id)
+        .join(Round, Match.round_id == Round.id)
+        .filter(Round.tournament_id == tournament_id)
+        .group_by(Match.strategy1_id, Match.strategy2_id)
+        .all()
+    )
+    return aggregate_payoffs(rows)
+
+
+def aggregate_payoffs(
+    rows: Iterable[tuple[int, int, int, int, int]],
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.float64]]:
+    """Payoff matrix from (strategy1_id, strategy2_id, score1, score2, turns) rows."""
+    rows = list(rows)
+    if not rows:
+        return np.empty(0, dtype=np.int64), np.empty((0, 0))
+
+    strategy1_ids, strategy2_ids, scores1, scores2, turns = (
+        np.array(column) for column in zip(*rows)
+    )
+    ids, index = np.unique(
+        np.concatenate([strategy1_ids, strategy2_ids]), return_inverse=True
+    )
+    index1, index2 = np.split(index, 2)
+
+    scores = np.zeros((ids.size, ids.size))
+    turns_played = np.zeros((ids.size, ids.size))
+    np.add.at(scores, (index1, index2), scores1.astype(np.float64))
+    np.add.at(scores, (index2, index1), scores2.astype(np.float64))
+    np.add.at(turns_played, (index1, index2), turns.astype(np.float64))
+    np.add.at(turns_played, (index2, index1), turns.astype(np.float64))
+
+    return ids.astype(np.int64), np.divide(
+        scores, turns_played, out=np.zeros_like(scores), where=turns_played > 0
+    )
+
+
+def population_dynamics(
+    payoffs: npt.NDArray[np.float64], generations_count: int
+) -> npt.NDArray[np.float64]:
+    """Discrete replicator dynamics starting from equal population shares.
+
+    Each generation a strategy's share grows in proportion to its average
+    payoff against the current population. Returns the shares of every
+    generation, shape (generations_count + 1, strategies).
+    """
+    strategies_count = payoffs.shape[0]
+    trajectory = np.empty((generations_count + 1, strategies_count))
+    trajectory[0] = 1 / strategies_count
+
+    for generation in range(1, generations_count + 1):
+        shares = trajectory[generation - 1]
+        fitness = payoffs @ shares
+        mean_fitness = shares @ fitness
+        if mean_fitness <= 0:
+            trajectory[generation:] = shares
+            break
+        trajectory[generation] = shares * fitness / mean_fitness
+
+    return trajectory
+
+
+def run_ecological(tournament_id: int, generations_count: int, session: Session):
+    if not 0 < generations_count <= MAX_GENERATIONS:
+        raise ValueError(
+            f"generations_count must be between 1 and {MAX_GENERATIONS}, got {generations_count}"
+        )
+    strategy_ids, payoffs = payoff_matrix(tournament_id, session)
+    if strategy_ids.size == 0:
+        return
+    trajectory = population_dynamics(payoffs, generations_count)
+
+    # Insert in batches so a long run is never materialized as one statement
+    generations_per_batch = max(1, INSERT_BATCH_SIZE // strategy_ids.size)
+    for start in range(0, len(trajectory), generations_per_batch):
+        session.execute(
+            insert(PopulationShare),
+            [
+                {
+                    "tournament_id": tournament_id,
+                    "generation": generation,
+                    "strategy_id": int(strategy_id),
+                    "share": float(share),
+                }
+                for generation, shares in enumerate(
+                    trajectory[start : start + generations_per_batch], start
+                )
+                for strategy_id, share in zip(strategy_ids, shares)
+            ],
+        )
+    session.commit()
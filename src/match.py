@@ -1,7 +1,8 @@
 import asyncio
-from typing import Mapping, Self
+from typing import Iterable, Mapping, Self
 
 from loguru import logger
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from .models import Match, MoveType, Side, Strategy, Turn
@@ -43,21 +44,25 @@ class MatchRunner:
             ),
         }
 
-        strategy_runners: dict[Side, StrategyRunner] = {}
-        try:
-            # Wait for all initializations to complete
-            await asyncio.gather(*init_tasks.values())
+        # Wait for all initializations to complete
+        results = await asyncio.gather(*init_tasks.values(), return_exceptions=True)
 
-            # Collect results
-            for side, task in init_tasks.items():
-                strategy_runners[side] = await task
-        except Exception as e:
+        # Collect results
+        strategy_runners: dict[Side, StrategyRunner] = {}
+        errors: list[BaseException] = []
+        for side, result in zip(init_tasks.keys(), results):
+            if isinstance(result, BaseException):
+                errors.append(result)
+            else:
+                strategy_runners[side] = result
+
+        if errors:
             logger.error(
-                f"Error initializing strategy runners for match {match.id}: {str(e)}"
+                f"Error initializing strategy runners for match {match.id}: {str(errors[0])}"
             )
-            for runner in strategy_runners.values():
-                runner.cleanup()
-            raise
+            # Remove the containers that did start
+            await cleanup_runners(match.id, strategy_runners.values())
+            raise errors[0]
 
         return cls(match.id, strategy_runners)
 
@@ -73,6 +78,12 @@ class MatchRunner:
         for turn_number in range(turns_count):
             await self.run_turn(turn_number, session)
 
+        match = session.get(Match, self.match_id)
+        assert match is not None
+        match.status = "completed"
+        match.end_time = func.now()
+        session.commit()
+
     async def run_turn(self, turn_number: int, session: Session):
         # Run both strategy moves in parallel
         move_tasks = {
@@ -120,6 +131,17 @@ class MatchRunner:
         other_side = self.OTHER_SIDE[side]
         return await runner.read_move(self.last_moves[other_side])
 
-    def cleanup(self):
-        for runner in self.strategy_runners.values():
-            runner.cleanup()
+    async def cleanup(self):
+        await cleanup_runners(self.match_id, self.strategy_runners.values())
+
+
+async def cleanup_runners(match_id: int, runners: Iterable[StrategyRunner]):
+    runners = list(runners)
+    results = await asyncio.gather(
+        *(runner.cleanup() for runner in runners), return_exceptions=True
+    )
+    for runner, result in zip(runners, results):
+        if isinstance(result, BaseException):
+            logger.error(
+                f"Error removing container {runner.container.name} of match {match_id}: {str(result)}"
+            )
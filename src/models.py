@@ -4,6 +4,7 @@ from sqlalchemy import (
     TIMESTAMP,
     Column,
     Enum,
+    Float,
     ForeignKey,
     Integer,
     String,
@@ -13,8 +14,6 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
-import database
-
 
 class Base(DeclarativeBase):
     pass
@@ -104,4 +103,17 @@ class Turn(Base):
     __table_args__ = (UniqueConstraint("match_id", "turn_number", "side"),)
 
 
-Base.metadata.create_all(bind=database.engine)
+class PopulationShare(Base):
+    __tablename__ = "population_shares"
+
+    id = mapped_column(Integer, primary_key=True, index=True)
+    tournament_id = mapped_column(
+        Integer, ForeignKey("tournaments.id", ondelete="CASCADE"), nullable=False
+    )
+    generation = mapped_column(Integer, nullable=False)
+    strategy_id = mapped_column(
+        Integer, ForeignKey("strategies.id", ondelete="CASCADE"), nullable=False
+    )
+    share = mapped_column(Float, nullable=False)
+
+    __table_args__ = (UniqueConstraint("tournament_id", "generation", "strategy_id"),)
@@ -0,0 +1,132 @@
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Hashable
+
+from fastapi import Request, Response
+
+# Upper bound on the rendered bytes kept in memory
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+# Lifetime of pages whose tournament or match is still in progress
+IN_PROGRESS_TTL_SEC = 2.0
+# Number of pages whose last Last-Modified value is remembered
+MAX_TRACKED_KEYS = 10_000
+
+
+@dataclass
+class CacheEntry:
+    body: bytes
+    media_type: str | None
+    etag: str
+    last_modified: int
+    expires_at: float | None
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {
+            "ETag": self.etag,
+            "Last-Modified": formatdate(self.last_modified, usegmt=True),
+            "Cache-Control": "no-cache",
+        }
+
+    def is_fresh(self) -> bool:
+        return self.expires_at is None or time.monotonic() < self.expires_at
+
+    def is_not_modified(self, request: Request) -> bool:
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            return "*" in tags or self.etag in tags
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return self.last_modified <= since
+        return False
+
+    def to_response(self, request: Request) -> Response:
+        if self.is_not_modified(request):
+            return Response(status_code=304, headers=self.headers)
+        return Response(
+            content=self.body, media_type=self.media_type, headers=self.headers
+        )
+
+
+class ResponseCache:
+    """In-memory LRU cache of rendered pages with ETag / Last-Modified support.
+
+    Pages of completed entities are kept until evicted, pages of entities that
+    may still change expire after a short TTL.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = MAX_CACHE_BYTES,
+        in_progress_ttl: float = IN_PROGRESS_TTL_SEC,
+    ):
+        self.max_bytes = max_bytes
+        self.in_progress_ttl = in_progress_ttl
+        self.entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self.size = 0
+        self.last_modified: OrderedDict[Hashable, int] = OrderedDict()
+
+    def get(self, request: Request, key: Hashable) -> Response | None:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if not entry.is_fresh():
+            self.invalidate(key)
+            return None
+        self.entries.move_to_end(key)
+        return entry.to_response(request)
+
+    def store(
+        self, request: Request, key: Hashable, response: Response, final: bool
+    ) -> Response:
+        body = bytes(response.body)
+        entry = CacheEntry(
+            body=body,
+            media_type=response.media_type,
+            etag=f'"{hashlib.sha1(body).hexdigest()}"',
+            last_modified=self._next_last_modified(key),
+            expires_at=None if final else time.monotonic() + self.in_progress_ttl,
+        )
+
+        self.invalidate(key)
+        if len(body) <= self.max_bytes:
+            self.entries[key] = entry
+            self.size += len(body)
+            while self.size > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= len(evicted.body)
+
+        return entry.to_response(request)
+
+    def _next_last_modified(self, key: Hashable) -> int:
+        # Last-Modified has a resolution of one second, so a page rendered
+        # again within the same second must still get a later value
+        last_modified = int(time.time())
+        previous = self.last_modified.pop(key, None)
+        if previous is not None and last_modified <= previous:
+            last_modified = previous + 1
+        self.last_modified[key] = last_modified
+        if len(self.last_modified) > MAX_TRACKED_KEYS:
+            self.last_modified.popitem(last=False)
+        return last_modified
+
+    def invalidate(self, key: Hashable):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry.body)
+
+    def clear(self):
+        self.entries.clear()
+        self.size = 0
+
+
+response_cache = ResponseCache()
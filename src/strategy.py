@@ -1,9 +1,11 @@
 import asyncio
+import functools
 import os
 import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from socket import SocketIO
-from typing import Self
+from typing import Any, Callable, Self, TypeVar
 
 import docker
 import docker.models
@@ -13,21 +15,87 @@ from loguru import logger
 
 from .models import MoveType
 
+T = TypeVar("T")
+
 REGISTRY = "localhost:5000"
 MISCOMMUNICATION_PROBABILITY = 0.0
 
+# Threads dedicated to blocking Docker API calls. Every live container polls
+# its logs each turn, holding a worker for one round trip per poll, so this
+# is sized for the several hundred containers of a large round
+DOCKER_IO_WORKERS = 128
+# Connections kept alive to the Docker daemon socket, one per I/O worker
+DOCKER_MAX_POOL_SIZE = DOCKER_IO_WORKERS
+# Container removals allowed in flight at once, so the cleanup of one
+# tournament's round cannot take every I/O worker from the matches of other
+# tournaments running at the same time
+DOCKER_CLEANUP_CONCURRENCY = DOCKER_IO_WORKERS // 4
+
+_docker_client: docker.DockerClient | None = None
+_docker_executor: ThreadPoolExecutor | None = None
+_cleanup_semaphore: asyncio.Semaphore | None = None
+
+
+async def get_docker_client() -> docker.DockerClient:
+    global _docker_client
+    if _docker_client is None:
+        # Creating the client asks the daemon for its API version
+        client = await run_docker_io(
+            docker.from_env, max_pool_size=DOCKER_MAX_POOL_SIZE
+        )
+        if _docker_client is None:
+            _docker_client = client
+        else:
+            # Created concurrently by another coroutine in the meantime
+            client.close()
+    return _docker_client
+
+
+def _get_docker_io() -> tuple[ThreadPoolExecutor, asyncio.Semaphore]:
+    global _docker_executor, _cleanup_semaphore
+    if _docker_executor is None or _cleanup_semaphore is None:
+        _docker_executor = ThreadPoolExecutor(
+            max_workers=DOCKER_IO_WORKERS, thread_name_prefix="docker-io"
+        )
+        _cleanup_semaphore = asyncio.Semaphore(DOCKER_CLEANUP_CONCURRENCY)
+    return _docker_executor, _cleanup_semaphore
+
+
+async def run_docker_io(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    executor, _ = _get_docker_io()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, functools.partial(func, *args, **kwargs)
+    )
+
+
+def close_docker_client():
+    global _docker_client, _docker_executor, _cleanup_semaphore
+    if _docker_executor is not None:
+        _docker_executor.shutdown(wait=True)
+        _docker_executor = None
+        _cleanup_semaphore = None
+    if _docker_client is not None:
+        _docker_client.close()
+        _docker_client = None
+
 
 class StrategyRunner:
     TIMEOUT_SEC = 0.1
+    # Delay between log polls, doubled after every poll without new output
+    POLL_INTERVAL_MIN_SEC = 0.002
+    POLL_INTERVAL_MAX_SEC = 0.02
+    # Log lines fetched per poll, only the newest output is of interest
+    LOG_TAIL_LINES = 8
 
     @classmethod
     async def create(cls, image_name: str, container_name: str) -> Self:
-        client = docker.from_env()
-        container = await asyncio.to_thread(
+        client = await get_docker_client()
+        await run_docker_io(
             client.images.pull,
             f"{REGISTRY}/{image_name}:2",
         )
-        container = await asyncio.to_thread(
+        container = await run_docker_io(
             client.containers.run,
             f"{REGISTRY}/{image_name}:2",
             name=container_name,
@@ -37,8 +105,9 @@ class StrategyRunner:
         )
         logger.debug(f"{container.name} | {image_name} | Started")
 
-        stdin_socket: SocketIO = container.attach_socket(  # type: ignore
-            params={"stdin": 1, "stream": 1}
+        stdin_socket: SocketIO = await run_docker_io(
+            container.attach_socket,  # type: ignore
+            params={"stdin": 1, "stream": 1},
         )
 
         return cls(image_name, container, stdin_socket)  # type: ignore
@@ -52,7 +121,8 @@ class StrategyRunner:
         self.image_name = image_name
         self.container = container
         self.stdin_socket = stdin_socket
-        self.lines_read = 0
+        # Timestamp of the last log line read, to tell new output apart
+        self.last_output_timestamp: str | None = None
 
     async def read_move(
         self, opponent_previous_move: MoveType | None = None
@@ -71,16 +141,17 @@ class StrategyRunner:
             )
 
         start_time = time.time()
+        poll_interval = self.POLL_INTERVAL_MIN_SEC
         while time.time() - start_time <= self.TIMEOUT_SEC:
-            output_lines = self.container.logs().decode().splitlines()
-            lines_count = len(output_lines)
-            if lines_count <= self.lines_read:
+            output_lines = await self._read_new_output()
+            if not output_lines:
+                await asyncio.sleep(poll_interval)
+                poll_interval = min(poll_interval * 2, self.POLL_INTERVAL_MAX_SEC)
                 continue
-            if lines_count > self.lines_read + 1:
+            if len(output_lines) > 1:
                 logger.warning(
                     f"{self.container.name} | {self.image_name} | Multiple outputs in one round"
                 )
-            self.lines_read = lines_count
             output = output_lines[-1]
             try:
                 move = MoveType(output)
@@ -98,6 +169,27 @@ class StrategyRunner:
         )
         return None
 
-    def cleanup(self):
-        self.container.remove(force=True)
+    async def _read_new_output(self) -> list[str]:
+        logs: bytes = await run_docker_io(
+            self.container.logs, tail=self.LOG_TAIL_LINES, timestamps=True
+        )
+        timestamps: list[str] = []
+        outputs: list[str] = []
+        for line in logs.decode().splitlines():
+            timestamp, _, output = line.partition(" ")
+            timestamps.append(timestamp)
+            outputs.append(output)
+        if not timestamps:
+            return []
+
+        # Lines up to the last one already read were returned by earlier polls
+        if self.last_output_timestamp in timestamps:
+            outputs = outputs[timestamps.index(self.last_output_timestamp) + 1 :]
+        self.last_output_timestamp = timestamps[-1]
+        return outputs
+
+    async def cleanup(self):
+        _, cleanup_semaphore = _get_docker_io()
+        async with cleanup_semaphore:
+            await run_docker_io(self.container.remove, force=True)
         logger.debug(f"{self.container.name} | {self.image_name} | Removed forcefully")
@@ -3,19 +3,28 @@ import random
 from itertools import combinations_with_replacement
 
 from loguru import logger
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from .ecological import run_ecological
 from .match import MatchRunner
 from .models import Round, Strategy, Tournament
 
 
 class TournamentRunner:
-    def __init__(self, strategy_ids: list[int], rounds_count: int, session: Session):
+    def __init__(
+        self,
+        strategy_ids: list[int],
+        rounds_count: int,
+        session: Session,
+        generations_count: int = 0,
+    ):
         strategies = session.query(Strategy).filter(Strategy.id.in_(strategy_ids)).all()
         tournament = Tournament(rounds_count=rounds_count, strategies=strategies)
         session.add(tournament)
         session.commit()
         self.tournament_id = tournament.id
+        self.generations_count = generations_count
 
     async def run(self, session: Session):
         tournament = session.get(Tournament, self.tournament_id)
@@ -36,6 +45,17 @@ class TournamentRunner:
                 round_obj.id, tournament_strategies, turns_count, session
             )
 
+        if self.generations_count > 0:
+            # Evolve population shares from the round-robin payoffs, off the
+            # event loop that runs the matches of other tournaments
+            await asyncio.to_thread(
+                run_ecological, self.tournament_id, self.generations_count, session
+            )
+
+        tournament.status = "completed"
+        tournament.end_time = func.now()
+        session.commit()
+
     async def run_round(
         self,
         round_id: int,
@@ -68,5 +88,5 @@ class TournamentRunner:
                     task.cancel()
             raise
         finally:
-            for runner in match_runners:
-                runner.cleanup()
+            # Failed removals are logged by each match's cleanup
+            await asyncio.gather(*(runner.cleanup() for runner in match_runners))
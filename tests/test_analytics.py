@@ -0,0 +1,111 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from src import analytics as analytics_module
+from src.analytics import compute_analytics, tournament_analytics, unpack_moves
+
+TIT_FOR_TAT = 1
+ALTERNATOR = 2
+GRUDGER = 3
+COOPERATOR = 4
+
+
+def analytics(*rows: tuple[int, int, str | None, str | None]):
+    return compute_analytics(*unpack_moves(rows))
+
+
+def test_tit_for_tat_against_alternating_defector():
+    result = analytics((TIT_FOR_TAT, ALTERNATOR, "CDCDCDCD", "DCDCDCDC"))
+
+    tit_for_tat = result[TIT_FOR_TAT]
+    assert tit_for_tat.cooperation_rate == 0.5
+    assert tit_for_tat.retaliation_rate == 1.0
+    assert tit_for_tat.forgiveness_rate == 1.0
+    assert tit_for_tat.first_defection_turn == 1.0
+    # Never in mutual cooperation, so there is no stray defection to react to
+    assert tit_for_tat.noise_sensitivity is None
+
+    alternator = result[ALTERNATOR]
+    assert alternator.cooperation_rate == 0.5
+    assert alternator.retaliation_rate == 1.0
+    assert alternator.forgiveness_rate == 1.0
+    assert alternator.first_defection_turn == 0.0
+    assert alternator.noise_sensitivity is None
+
+
+def test_single_noise_defection():
+    result = analytics(
+        (TIT_FOR_TAT, COOPERATOR, "CCCDCCCCCC", "CCDCCCCCCC"),
+        (GRUDGER, COOPERATOR, "CCCDDDDDDD", "CCDCCCCCCC"),
+    )
+
+    # Defection at turn 2, reaction measured over turns 3 to 7
+    assert result[TIT_FOR_TAT].noise_sensitivity == pytest.approx(1 / 5)
+    assert result[GRUDGER].noise_sensitivity == 1.0
+    assert result[GRUDGER].forgiveness_rate == 0.0
+    assert result[TIT_FOR_TAT].forgiveness_rate == 1.0
+
+    cooperator = result[COOPERATOR]
+    assert cooperator.cooperation_rate == pytest.approx(18 / 20)
+    assert cooperator.retaliation_rate == 0.0
+    assert cooperator.first_defection_turn == 2.0
+
+
+def test_noise_window_is_clipped_at_match_end():
+    result = analytics(
+        (TIT_FOR_TAT, COOPERATOR, "CCCCCCCC", "CCCCCCCD"),
+        (GRUDGER, COOPERATOR, "CCCCCCCCCD", "CCCCCCCCDC"),
+    )
+
+    # Stray defection in the last turn leaves no turns to react in
+    assert result[TIT_FOR_TAT].noise_sensitivity is None
+    assert result[GRUDGER].noise_sensitivity == 1.0
+
+
+def test_self_play_and_matches_of_different_lengths():
+    result = analytics(
+        (TIT_FOR_TAT, TIT_FOR_TAT, "CCCC", "CCCC"),
+        (TIT_FOR_TAT, GRUDGER, "CCCCCC", "CCCCCC"),
+        (GRUDGER, GRUDGER, "DD", "DD"),
+    )
+
+    assert result[TIT_FOR_TAT].cooperation_rate == 1.0
+    assert result[TIT_FOR_TAT].first_defection_turn is None
+    assert result[TIT_FOR_TAT].retaliation_rate is None
+    # Six cooperations against Tit for Tat and four defections against itself
+    assert result[GRUDGER].cooperation_rate == pytest.approx(6 / 10)
+    assert result[GRUDGER].retaliation_rate == 1.0
+    assert result[GRUDGER].first_defection_turn == 0.0
+
+
+def test_no_moves():
+    assert analytics() == {}
+    assert analytics((TIT_FOR_TAT, GRUDGER, None, None)) == {}
+
+
+def test_concurrent_requests_compute_once(monkeypatch: pytest.MonkeyPatch):
+    loads: list[int] = []
+    loads_lock = threading.Lock()
+
+    def load_moves(tournament_id: int, session: object):
+        with loads_lock:
+            loads.append(tournament_id)
+        time.sleep(0.05)
+        return unpack_moves([(TIT_FOR_TAT, GRUDGER, "CC", "CD")])
+
+    monkeypatch.setattr(analytics_module, "load_moves", load_moves)
+    monkeypatch.setattr(analytics_module, "_cache", type(analytics_module._cache)())
+    session = SimpleNamespace(get=lambda model, id_: SimpleNamespace(status="completed"))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(lambda _: tournament_analytics(1, session), range(8))  # type: ignore
+        )
+
+    assert loads == [1]
+    assert all(result is results[0] for result in results)
+    assert results[0][GRUDGER].cooperation_rate == pytest.approx(0.5)
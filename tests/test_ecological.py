@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from src.ecological import aggregate_payoffs, population_dynamics
+
+COOPERATOR = 1
+DEFECTOR = 2
+
+PRISONERS_DILEMMA = np.array([[3.0, 0.0], [5.0, 1.0]])
+
+
+def test_aggregate_payoffs():
+    ids, payoffs = aggregate_payoffs(
+        [
+            # Self-play adds both sides to the diagonal
+            (COOPERATOR, COOPERATOR, 30, 30, 10),
+            # Repeated pairings from several rounds are summed
+            (COOPERATOR, DEFECTOR, 0, 50, 10),
+            (COOPERATOR, DEFECTOR, 0, 100, 20),
+            (DEFECTOR, DEFECTOR, 10, 10, 10),
+        ]
+    )
+
+    assert ids.tolist() == [COOPERATOR, DEFECTOR]
+    np.testing.assert_allclose(payoffs, PRISONERS_DILEMMA)
+
+
+def test_aggregate_payoffs_without_matches():
+    ids, payoffs = aggregate_payoffs([])
+    assert ids.size == 0
+    assert payoffs.shape == (0, 0)
+
+
+def test_replicator_step():
+    trajectory = population_dynamics(PRISONERS_DILEMMA, 1)
+
+    # Fitness 1.5 and 3 against a mean fitness of 2.25
+    np.testing.assert_allclose(trajectory, [[1 / 2, 1 / 2], [1 / 3, 2 / 3]])
+
+
+def test_defectors_take_over():
+    trajectory = population_dynamics(PRISONERS_DILEMMA, 50)
+
+    assert trajectory.shape == (51, 2)
+    np.testing.assert_allclose(trajectory.sum(axis=1), 1)
+    assert np.all(np.diff(trajectory[:, 1]) >= 0)
+    assert trajectory[-1, 1] == pytest.approx(1, abs=1e-6)
+
+
+def test_zero_payoffs_keep_shares():
+    trajectory = population_dynamics(np.zeros((2, 2)), 3)
+    np.testing.assert_allclose(trajectory, np.full((4, 2), 1 / 2))
@@ -0,0 +1,64 @@
+from fastapi import Request, Response
+
+from src.response_cache import ResponseCache
+
+
+def make_request(**headers: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [
+                (name.replace("_", "-").encode(), value.encode())
+                for name, value in headers.items()
+            ],
+        }
+    )
+
+
+def test_etag_revalidation():
+    cache = ResponseCache()
+    response = cache.store(make_request(), "page", Response(b"body"), final=True)
+    assert response.status_code == 200
+
+    cached = cache.get(make_request(if_none_match=response.headers["etag"]), "page")
+    assert cached is not None
+    assert cached.status_code == 304
+
+    cached = cache.get(make_request(if_none_match='"other"'), "page")
+    assert cached is not None
+    assert cached.status_code == 200
+    assert cached.body == b"body"
+
+
+def test_rerender_within_same_second_is_modified():
+    cache = ResponseCache()
+    first = cache.store(make_request(), "page", Response(b"old"), final=False)
+    cache.invalidate("page")
+    second = cache.store(make_request(), "page", Response(b"new"), final=False)
+    assert first.headers["last-modified"] != second.headers["last-modified"]
+
+    request = make_request(if_modified_since=first.headers["last-modified"])
+    cached = cache.get(request, "page")
+    assert cached is not None
+    assert cached.status_code == 200
+    assert cached.body == b"new"
+
+    request = make_request(if_modified_since=second.headers["last-modified"])
+    cached = cache.get(request, "page")
+    assert cached is not None
+    assert cached.status_code == 304
+
+
+def test_lru_eviction_by_size():
+    cache = ResponseCache(max_bytes=8)
+    cache.store(make_request(), "a", Response(b"aaaa"), final=True)
+    cache.store(make_request(), "b", Response(b"bbbb"), final=True)
+    assert cache.get(make_request(), "a") is not None
+    cache.store(make_request(), "c", Response(b"cccc"), final=True)
+
+    assert cache.get(make_request(), "b") is None
+    assert cache.get(make_request(), "a") is not None
+    assert cache.get(make_request(), "c") is not None
+    assert cache.size == 8
@@ -0,0 +1,54 @@
+import pytest
+
+from src.models import MoveType
+from src.strategy import StrategyRunner
+
+
+class FakeContainer:
+    name = "fake"
+
+    def __init__(self):
+        self.lines: list[str] = []
+
+    def logs(self, tail: int, timestamps: bool) -> bytes:
+        assert timestamps
+        return "".join(f"{line}\n" for line in self.lines[-tail:]).encode()
+
+
+def make_runner(container: FakeContainer) -> StrategyRunner:
+    return StrategyRunner("fake", container, None)  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_only_new_output_is_read():
+    container = FakeContainer()
+    runner = make_runner(container)
+    assert await runner.read_move() is None
+
+    container.lines.append("2025-01-01T00:00:00.1Z C")
+    assert await runner.read_move() == MoveType.C
+
+    # Earlier output is not read again
+    assert await runner.read_move() is None
+
+    container.lines.append("2025-01-01T00:00:00.2Z D")
+    assert await runner.read_move() == MoveType.D
+
+
+@pytest.mark.asyncio
+async def test_multiple_outputs_use_the_last_one():
+    container = FakeContainer()
+    runner = make_runner(container)
+    container.lines.append("2025-01-01T00:00:00.1Z C")
+    assert await runner.read_move() == MoveType.C
+
+    container.lines += ["2025-01-01T00:00:00.2Z C", "2025-01-01T00:00:00.3Z D"]
+    assert await runner.read_move() == MoveType.D
+
+
+@pytest.mark.asyncio
+async def test_invalid_output():
+    container = FakeContainer()
+    runner = make_runner(container)
+    container.lines.append("2025-01-01T00:00:00.1Z maybe")
+    assert await runner.read_move() is None